@@ -1,14 +1,18 @@
 #!/usr/bin/env python3
 import sys
-import json
 import os
-import subprocess
+import shutil
+import tempfile
+import uuid
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
 from PySide6.QtGui import QGuiApplication
 
 from PySide6.QtCore import (
     Qt,
+    QProcess,
+    QSignalMapper,
     QTimer,
     QSize,
     Slot
@@ -34,74 +38,229 @@ from PySide6.QtWidgets import (
     QMenu
 )
 
-CONFIG_FILE = str(Path(__file__).parent / "config.json")
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to ujson, then the stdlib parser
+    orjson = None
+    import json
+    try:
+        from ujson import loads as _json_loads
+    except ImportError:
+        _json_loads = json.loads
+
+# One small file per connection, so editing one connection doesn't rewrite the rest
+CONFIG_DIR = Path(__file__).parent / "config.d"
+SETTINGS_FILE = CONFIG_DIR / "settings.json"
+INDEX_FILE = CONFIG_DIR / "index.json"
+# Single-file config used by older versions, migrated on first start
+LEGACY_CONFIG_FILE = Path(__file__).parent / "config.json"
+STARTUP_OPTIONS = ("When logged in", "On lid open", "Never", "Manual only")
+SHUTOFF_OPTIONS = ("On log off", "On lid close", "Never")
+DEFAULT_SETTINGS = {
+    "startup": STARTUP_OPTIONS[0],
+    "shutoff": SHUTOFF_OPTIONS[0]
+}
 DEFAULT_PORT = 1080
 DEFAULT_SOCKS_HOST = "127.0.0.1"
+SOCKS_LABEL = f"SOCKS5 {DEFAULT_SOCKS_HOST}:{DEFAULT_PORT}"
+TRAY_ICON_NAME = "network-wired"
+SAVE_DEBOUNCE_MS = 500
+
+# Parsed once for the whole window instead of per widget on every render
+STYLESHEET = """
+QLabel#topLabel { font-weight: bold; font-size: 16px; }
+QLabel#statusLabel { color: red; font-size: 14px; font-weight: bold; }
+QLabel#statusLabel[connected="true"] { color: green; }
+QWidget#connRow, QWidget#connRow QWidget { background-color: #f0f0f0; border-radius: 10px; }
+QLabel#connName { color: black; font-weight: bold; }
+QLabel#connUrl { color: gray; font-size: 10px; }
+QPushButton#connBtn { color: black; }
+QPushButton#addBtn {
+    border-radius: 20px;
+    font-size: 24px;
+    background-color: #2196F3;
+    color: white;
+}
+"""
+
+
+def _read_json(path: Path):
+    """Read and parse a JSON file; raises FileNotFoundError if it is missing."""
+    return _json_loads(path.read_bytes())
+
+
+def _encode_default(obj):
+    """Serialize objects the JSON encoder doesn't know natively."""
+    if isinstance(obj, Connection):
+        return {"name": obj.name, "url": obj.url, "arguments": obj.arguments}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _write_json(path: Path, obj):
+    """Atomically replace 'path' with 'obj' serialized as JSON."""
+    if orjson is not None:
+        # Pass dataclasses through to _encode_default; the id is the file name, not content
+        data = orjson.dumps(
+            obj,
+            default=_encode_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+    else:
+        data = json.dumps(obj, default=_encode_default, indent=2).encode()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            # One explicit flush to disk, so the rename never exposes a partial file
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
 
 
 def load_config() -> Dict:
-    """Load configuration from config.json or return defaults if missing."""
-    if not os.path.exists(CONFIG_FILE):
-        return {
-            "connections": [],
-            "settings": {
-                "startup": "When logged in",
-                "shutoff": "On log off"
-            }
-        }
-    with open(CONFIG_FILE, "r") as f:
-        return json.load(f)
-
-
-def save_config(config_data: Dict):
-    """Save configuration to config.json."""
-    with open(CONFIG_FILE, "w") as f:
-        json.dump(config_data, f, indent=4)
-
-
-class Connection:
-    """Model for a Chisel connection."""
-    def __init__(self, name: str, url: str, arguments: str):
-        self.name = name
-        self.url = url
-        self.arguments = arguments
-
-    def to_dict(self):
-        return {
-            "name": self.name,
-            "url": self.url,
-            "arguments": self.arguments
-        }
-
-    @staticmethod
-    def from_dict(data: Dict):
-        return Connection(data["name"], data["url"], data["arguments"])
+    """Load connections and settings from CONFIG_DIR or return defaults if missing."""
+    if not CONFIG_DIR.is_dir():
+        try:
+            legacy = _read_json(LEGACY_CONFIG_FILE)
+        except FileNotFoundError:
+            return {"connections": [], "settings": dict(DEFAULT_SETTINGS)}
+        return _migrate_legacy_config(legacy)
+
+    try:
+        settings = _read_json(SETTINGS_FILE)
+    except FileNotFoundError:
+        settings = dict(DEFAULT_SETTINGS)
+    except ValueError as e:
+        print(f"Ignoring unreadable settings file {SETTINGS_FILE}: {e}", file=sys.stderr)
+        settings = dict(DEFAULT_SETTINGS)
+
+    connections = {}
+    for path in CONFIG_DIR.glob("*.json"):
+        if path in (SETTINGS_FILE, INDEX_FILE):
+            continue
+        # A damaged file only loses its own connection, the rest still load
+        try:
+            connections[path.stem] = _load_connection(path)
+        except (OSError, ValueError, TypeError) as e:
+            print(f"Skipping unreadable connection file {path}: {e}", file=sys.stderr)
+
+    # Keep the saved order; files missing from the index go last
+    try:
+        order = _read_json(INDEX_FILE)
+    except FileNotFoundError:
+        order = []
+    except ValueError as e:
+        print(f"Ignoring unreadable index file {INDEX_FILE}: {e}", file=sys.stderr)
+        order = []
+    ordered = [connections.pop(conn_id) for conn_id in order if conn_id in connections]
+    ordered.extend(connections[conn_id] for conn_id in sorted(connections))
+    return {"connections": ordered, "settings": settings}
+
+
+def _load_connection(path: Path) -> "Connection":
+    """Build a Connection from its config file; raises ValueError/TypeError if malformed."""
+    data = _read_json(path)
+    if not isinstance(data, dict) or not all(isinstance(v, str) for v in data.values()):
+        raise TypeError("expected a JSON object of strings")
+    # Missing or unexpected keys raise TypeError here
+    return Connection(id=path.stem, **data)
+
+
+def _migrate_legacy_config(legacy: Dict) -> Dict:
+    """
+    Split an old single-file config.json into the CONFIG_DIR layout.
+    The new layout is built in a temporary directory and renamed into place
+    last, so an interrupted migration leaves config.json in charge.
+    """
+    connections = [Connection(**c) for c in legacy.get("connections", [])]
+    settings = legacy.get("settings", {})
+    tmp_dir = Path(tempfile.mkdtemp(dir=CONFIG_DIR.parent, prefix=f".{CONFIG_DIR.name}-"))
+    try:
+        for conn in connections:
+            _write_json(tmp_dir / f"{conn.id}.json", conn)
+        _write_json(tmp_dir / INDEX_FILE.name, [conn.id for conn in connections])
+        _write_json(tmp_dir / SETTINGS_FILE.name, settings)
+        os.replace(tmp_dir, CONFIG_DIR)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+    return {"connections": connections, "settings": settings}
+
+
+def save_connection(conn: "Connection"):
+    """Write a single connection to CONFIG_DIR/<id>.json."""
+    _write_json(CONFIG_DIR / f"{conn.id}.json", conn)
+
+
+def delete_connection_file(conn_id: str):
+    """Remove a connection's file from CONFIG_DIR."""
+    try:
+        (CONFIG_DIR / f"{conn_id}.json").unlink()
+    except FileNotFoundError:
+        pass
+
+
+def save_index(conn_ids: List[str]):
+    """Write the display order of the connections."""
+    _write_json(INDEX_FILE, conn_ids)
+
+
+def save_settings(settings_data: Dict):
+    """Write the global settings."""
+    _write_json(SETTINGS_FILE, settings_data)
+
+
+class _ConnectionCache:
+    """Slots for state derived from a Connection's fields, kept out of fields()."""
+    __slots__ = ("args_list",)
+
+
+@dataclass(slots=True, eq=False)
+class Connection(_ConnectionCache):
+    """Model for a Chisel connection; compared by identity, like any other object."""
+    name: str
+    url: str
+    arguments: str
+    # Stable identity, independent of list position; also names the config file
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+
+    def __post_init__(self):
+        # The extra chisel arguments, split once here rather than on every connect
+        self.args_list = self.arguments.split()
+
+
+def _persisted_state(conn: Connection):
+    """The fields of a connection that end up in its config file."""
+    return (conn.name, conn.url, conn.arguments)
+
+
+@dataclass
+class ConnectionRow:
+    """Widgets making up one rendered connection row."""
+    widget: QWidget
+    name_label: QLabel
+    url_label: QLabel
+    connect_btn: QPushButton
+    disconnect_btn: QPushButton
 
 
 class AddConnectionDialog(QDialog):
-    def __init__(self, parent=None, connection=None, index=None):
+    """Dialog for adding or editing a connection; built once and reused via reset()."""
+    def __init__(self, parent=None, connection=None):
         super().__init__(parent)
-        self.setWindowTitle("Add Chisel Connection" if connection is None else "Edit Chisel Connection")
         self.setFixedSize(400, 200)
 
-        self.connection = connection
-        self.index = index
-
         layout = QFormLayout()
 
         self.name_edit = QLineEdit()
         self.url_edit = QLineEdit()
         self.args_edit = QLineEdit()
 
-        # Populate fields if editing
-        if self.connection:
-            self.name_edit.setText(self.connection.name)
-            self.url_edit.setText(self.connection.url)
-            self.args_edit.setText(self.connection.arguments)
-        else:
-            # Default argument includes "socks"
-            self.args_edit.setText("socks")
-
         layout.addRow("Name:", self.name_edit)
         layout.addRow("URL:", self.url_edit)
         layout.addRow("Arguments:", self.args_edit)
@@ -113,13 +272,12 @@ class AddConnectionDialog(QDialog):
         btn_layout.addWidget(self.save_btn)
         btn_layout.addWidget(self.cancel_btn)
 
-        # If editing an existing connection, also add a Delete button
-        if self.connection is not None and self.index is not None:
-            self.delete_btn = QPushButton("Delete")
-            # Optional: Make it red or style it differently
-            # self.delete_btn.setStyleSheet("background-color: #e53935; color: white;")
-            btn_layout.addWidget(self.delete_btn)
-            self.delete_btn.clicked.connect(self.delete_connection)
+        # Delete button, only shown when editing an existing connection
+        self.delete_btn = QPushButton("Delete")
+        # Optional: Make it red or style it differently
+        # self.delete_btn.setStyleSheet("background-color: #e53935; color: white;")
+        btn_layout.addWidget(self.delete_btn)
+        self.delete_btn.clicked.connect(self.delete_connection)
 
         layout.addRow(btn_layout)
         self.setLayout(layout)
@@ -128,13 +286,38 @@ class AddConnectionDialog(QDialog):
         self.save_btn.clicked.connect(self.save_connection)
         self.cancel_btn.clicked.connect(self.reject)
 
+        self._empty_warning = QMessageBox(
+            QMessageBox.Warning, "Warning", "Name and URL cannot be empty.", QMessageBox.Ok, self
+        )
+
+        self.reset(connection)
+
+    def reset(self, connection=None):
+        """Prepare the dialog for adding (no connection) or editing 'connection'."""
+        self.setWindowTitle("Add Chisel Connection" if connection is None else "Edit Chisel Connection")
+        self.connection = connection
+
+        # Populate fields if editing
+        if self.connection:
+            self.name_edit.setText(self.connection.name)
+            self.url_edit.setText(self.connection.url)
+            self.args_edit.setText(self.connection.arguments)
+        else:
+            self.name_edit.clear()
+            self.url_edit.clear()
+            # Default argument includes "socks"
+            self.args_edit.setText("socks")
+
+        self.delete_btn.setVisible(self.connection is not None)
+        self.name_edit.setFocus()
+
     def save_connection(self):
         name = self.name_edit.text().strip()
         url = self.url_edit.text().strip()
         args = self.args_edit.text().strip()
 
         if not name or not url:
-            QMessageBox.warning(self, "Warning", "Name and URL cannot be empty.")
+            self._empty_warning.exec()
             return
 
         # Update existing or create new
@@ -142,6 +325,7 @@ class AddConnectionDialog(QDialog):
             self.connection.name = name
             self.connection.url = url
             self.connection.arguments = args
+            self.connection.args_list = args.split()
         else:
             self.connection = Connection(name, url, args)
 
@@ -153,42 +337,29 @@ class AddConnectionDialog(QDialog):
         to remove this connection from the list, then close.
         """
         main_window = self.parent()  # We expect the parent to be MainWindow
-        if hasattr(main_window, 'delete_connection') and self.index is not None:
-            main_window.delete_connection(self.index)
+        if hasattr(main_window, 'delete_connection') and self.connection is not None:
+            main_window.delete_connection(self.connection.id)
         self.reject()  # Or self.close(), ensures this dialog is done
 
 
 
 class SettingsDialog(QDialog):
-    """Dialog for application settings."""
+    """Dialog for application settings; built once and reused via reset()."""
     def __init__(self, parent=None, settings_data=None):
         super().__init__(parent)
         self.setWindowTitle("Settings")
         self.setFixedSize(400, 200)
 
-        self.settings_data = settings_data if settings_data else {}
-
         layout = QFormLayout()
 
         # Startup combo box
         self.startup_combo = QComboBox()
-        self.startup_combo.addItems([
-            "When logged in",
-            "On lid open",
-            "Never",
-            "Manual only"
-        ])
-        self.startup_combo.setCurrentText(self.settings_data.get("startup", "When logged in"))
+        self.startup_combo.addItems(STARTUP_OPTIONS)
         layout.addRow("Startup:", self.startup_combo)
 
         # Shutoff combo box
         self.shutoff_combo = QComboBox()
-        self.shutoff_combo.addItems([
-            "On log off",
-            "On lid close",
-            "Never",
-        ])
-        self.shutoff_combo.setCurrentText(self.settings_data.get("shutoff", "On log off"))
+        self.shutoff_combo.addItems(SHUTOFF_OPTIONS)
         layout.addRow("Shutoff:", self.shutoff_combo)
 
         # Buttons
@@ -204,6 +375,14 @@ class SettingsDialog(QDialog):
         self.save_btn.clicked.connect(self.save_settings)
         self.cancel_btn.clicked.connect(self.reject)
 
+        self.reset(settings_data)
+
+    def reset(self, settings_data=None):
+        """Show the values from 'settings_data' in the combo boxes."""
+        self.settings_data = settings_data if settings_data else {}
+        self.startup_combo.setCurrentText(self.settings_data.get("startup", DEFAULT_SETTINGS["startup"]))
+        self.shutoff_combo.setCurrentText(self.settings_data.get("shutoff", DEFAULT_SETTINGS["shutoff"]))
+
     @Slot()
     def save_settings(self):
         self.settings_data["startup"] = self.startup_combo.currentText()
@@ -217,19 +396,56 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.setWindowTitle("Chisel GUI Manager")
         self.resize(600, 400)
+        self.setStyleSheet(STYLESHEET)
 
         # Load config from file
-        self.config_data = load_config()
-        self.connections: List[Connection] = [
-            Connection.from_dict(c) for c in self.config_data.get("connections", [])
-        ]
-        self.settings_data = self.config_data.get("settings", {})
-
-        self.active_process = None  # Will hold the active chisel subprocess if any
-        self.active_connection_index = None
+        config_data = load_config()
+        self.connections: List[Connection] = config_data.get("connections", [])
+        # O(1) lookup by id for the row buttons; the list keeps display order
+        self._conns_by_id: Dict[str, Connection] = {c.id: c for c in self.connections}
+        self.settings_data = config_data.get("settings", {})
+        # What is currently on disk, so save_all only rewrites files that changed
+        self._saved_connections = {c.id: _persisted_state(c) for c in self.connections}
+        self._saved_order = tuple(c.id for c in self.connections)
+        self._saved_settings = tuple(self.settings_data.items())
+
+        # Coalesce rapid successive edits into a single write
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(SAVE_DEBOUNCE_MS)
+        self._save_timer.timeout.connect(self.save_all)
+        # Flush a pending save however the application ends, not only via closeEvent
+        QApplication.instance().aboutToQuit.connect(self.save_all)
+
+        self.active_process = None  # Will hold the active chisel QProcess if any
+        self.active_connection_id = None
+
+        # Widgets for each rendered row, keyed by connection id
+        self._rows: Dict[str, ConnectionRow] = {}
+        # Row whose buttons currently show the connected state
+        self._active_row: Optional[ConnectionRow] = None
+
+        # Dialogs are created on first use, then hidden and reused
+        self._add_dialog: Optional[AddConnectionDialog] = None
+        self._settings_dialog: Optional[SettingsDialog] = None
+
+        # Close prompt, built once and shown on every close
+        self._close_msgbox = QMessageBox(
+            QMessageBox.Question,
+            "Minimize to Tray?",
+            "Do you want to close the window and keep it running in the system tray, or fully exit?",
+            QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel,
+            self
+        )
+        self._close_msgbox.setDefaultButton(QMessageBox.Yes)
 
-        # To store references to connect/disconnect buttons for each row
-        self.connection_buttons = []  # list of (connect_btn, disconnect_btn)
+        # Row buttons are mapped to their connection id, one mapper per action
+        self._connect_mapper = QSignalMapper(self)
+        self._connect_mapper.mappedString.connect(self.connect_connection)
+        self._disconnect_mapper = QSignalMapper(self)
+        self._disconnect_mapper.mappedString.connect(self.disconnect_connection)
+        self._settings_mapper = QSignalMapper(self)
+        self._settings_mapper.mappedString.connect(self.open_connection_settings)
 
         # Central widget
         central_widget = QWidget(self)
@@ -242,13 +458,16 @@ class MainWindow(QMainWindow):
         top_widget.setLayout(top_layout)
 
         # SOCKS label
-        self.top_label = QLabel(f"SOCKS5 {DEFAULT_SOCKS_HOST}:{DEFAULT_PORT}")
-        self.top_label.setStyleSheet("font-weight: bold; font-size: 16px;")
+        self.top_label = QLabel(SOCKS_LABEL)
+        self.top_label.setObjectName("topLabel")
         top_layout.addWidget(self.top_label, alignment=Qt.AlignLeft)
 
         # Connection status label
         self.connection_status_label = QLabel("Not Connected")
-        self.connection_status_label.setStyleSheet("color: red; font-size: 14px; font-weight: bold;")
+        self.connection_status_label.setObjectName("statusLabel")
+        self.connection_status_label.setProperty("connected", False)
+        # Last (text, connected) pair applied to the label
+        self._last_status = ("Not Connected", False)
         top_layout.addWidget(self.connection_status_label, alignment=Qt.AlignRight)
 
         main_layout.addWidget(top_widget, alignment=Qt.AlignTop)
@@ -263,29 +482,27 @@ class MainWindow(QMainWindow):
         # Add button
         self.add_btn = QPushButton("+")
         self.add_btn.setFixedSize(QSize(40, 40))
-        self.add_btn.setStyleSheet(
-            "border-radius: 20px;"
-            "font-size: 24px;"
-            "background-color: #2196F3;"
-            "color: white;"
-        )
+        self.add_btn.setObjectName("addBtn")
         self.add_btn.clicked.connect(self.add_connection_dialog)
         main_layout.addWidget(self.add_btn, alignment=Qt.AlignRight)
 
-        # System Tray
+        # System Tray, set up once the event loop is running so it doesn't
+        # delay the first paint of the window
+        self.tray_icon = None
+        QTimer.singleShot(0, self._init_tray)
+
+    def _init_tray(self):
+        """Create the system tray icon and its menu."""
         self.tray_icon = QSystemTrayIcon(self)
-        self.tray_icon.setIcon(QIcon.fromTheme("network-wired"))
+        self.tray_icon.setIcon(QIcon.fromTheme(TRAY_ICON_NAME))
         self.tray_icon.setToolTip("Chisel GUI Manager")
-        tray_menu = QMenu()
+        self._tray_menu = QMenu(self)
         exit_action = QAction("Exit", self)
         exit_action.triggered.connect(self.close)
-        tray_menu.addAction(exit_action)
-        self.tray_icon.setContextMenu(tray_menu)
+        self._tray_menu.addAction(exit_action)
+        self.tray_icon.setContextMenu(self._tray_menu)
         self.tray_icon.activated.connect(self.on_tray_icon_activated)  # Connect the signal
         self.tray_icon.show()
-        self.status_timer = QTimer(self)
-        self.status_timer.timeout.connect(self.update_connection_status)
-        self.status_timer.start(1000)
 
     def on_tray_icon_activated(self, reason):
         """Handle tray icon activation."""
@@ -294,234 +511,304 @@ class MainWindow(QMainWindow):
             self.activateWindow()
             QGuiApplication.processEvents()  # Ensure the window is focused
 
-        # Timer to check process status
-          # check every second
-
     def render_connections(self):
-        """Render the connections in the layout."""
-        # Clear current layout & button references
-        self.connection_buttons.clear()
-        for i in reversed(range(self.connection_list_layout.count())):
-            item = self.connection_list_layout.itemAt(i)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
-            self.connection_list_layout.removeItem(item)
-
-        for idx, conn in enumerate(self.connections):
-            row_widget = QWidget()
-            row_layout = QHBoxLayout(row_widget)
-            row_layout.setContentsMargins(10, 5, 10, 5)
-            row_layout.setSpacing(10)
-
-            # Slightly lighter background, rounded corners
-            row_widget.setStyleSheet("""
-                background-color: #f0f0f0;
-                border-radius: 10px;
-            """)
-
-            # Connection name + url
-            text_widget = QWidget()
-            text_layout = QVBoxLayout(text_widget)
-            text_layout.setContentsMargins(0, 0, 0, 0)
-            text_layout.setSpacing(0)
-            name_label = QLabel(conn.name)
-            name_label.setStyleSheet("color: black; font-weight: bold")
-            url_label = QLabel(conn.url)
-            url_label.setStyleSheet("color: gray; font-size: 10px;")
-            text_layout.addWidget(name_label)
-            text_layout.addWidget(url_label)
-            row_layout.addWidget(text_widget, stretch=1)
-
-            # Connect and Disconnect buttons
-            connect_btn = QPushButton("Connect")
-            
-            disconnect_btn = QPushButton("Disconnect")
-
-            disconnect_btn.setStyleSheet("color: black")
-            connect_btn.setStyleSheet("color: black")
-
-            # By default, if nothing is connected, all connect buttons are enabled, disconnect disabled:
-            connect_btn.setEnabled(True)
-            disconnect_btn.setEnabled(False)
-
-            connect_btn.clicked.connect(lambda _, i=idx: self.connect_connection(i))
-            disconnect_btn.clicked.connect(lambda _, i=idx: self.disconnect_connection(i))
-
-            row_layout.addWidget(connect_btn)
-            row_layout.addWidget(disconnect_btn)
-
-            # Settings button
-            settings_button = QPushButton("Settings")
-            settings_button.setStyleSheet("color: black")
-            settings_button.clicked.connect(lambda _, i=idx: self.open_connection_settings(i))
-            row_layout.addWidget(settings_button)
-
-            self.connection_list_layout.addWidget(row_widget)
-            self.connection_buttons.append((connect_btn, disconnect_btn))
+        """Build the initial connection rows; later changes update rows individually."""
+        for conn in self.connections:
+            self._append_row(conn)
 
         # After creation, update button states
         self.update_buttons_state()
 
+    def _append_row(self, conn: Connection):
+        """Build the row widget for a single connection and append it to the list."""
+        row_widget = QWidget()
+        # Slightly lighter background, rounded corners (see STYLESHEET)
+        row_widget.setObjectName("connRow")
+        row_widget.setAttribute(Qt.WA_StyledBackground, True)
+        row_layout = QHBoxLayout(row_widget)
+        row_layout.setContentsMargins(10, 5, 10, 5)
+        row_layout.setSpacing(10)
+
+        # Connection name + url
+        text_widget = QWidget()
+        text_layout = QVBoxLayout(text_widget)
+        text_layout.setContentsMargins(0, 0, 0, 0)
+        text_layout.setSpacing(0)
+        name_label = QLabel(conn.name)
+        name_label.setObjectName("connName")
+        url_label = QLabel(conn.url)
+        url_label.setObjectName("connUrl")
+        text_layout.addWidget(name_label)
+        text_layout.addWidget(url_label)
+        row_layout.addWidget(text_widget, stretch=1)
+
+        # Connect and Disconnect buttons
+        connect_btn = QPushButton("Connect")
+
+        disconnect_btn = QPushButton("Disconnect")
+
+        disconnect_btn.setObjectName("connBtn")
+        connect_btn.setObjectName("connBtn")
+
+        # By default, if nothing is connected, all connect buttons are enabled, disconnect disabled:
+        connect_btn.setEnabled(True)
+        disconnect_btn.setEnabled(False)
+
+        # Map to the connection's id, not its position, so rows never need rewiring
+        self._connect_mapper.setMapping(connect_btn, conn.id)
+        connect_btn.clicked.connect(self._connect_mapper.map)
+        self._disconnect_mapper.setMapping(disconnect_btn, conn.id)
+        disconnect_btn.clicked.connect(self._disconnect_mapper.map)
+
+        row_layout.addWidget(connect_btn)
+        row_layout.addWidget(disconnect_btn)
+
+        # Settings button
+        settings_button = QPushButton("Settings")
+        settings_button.setObjectName("connBtn")
+        self._settings_mapper.setMapping(settings_button, conn.id)
+        settings_button.clicked.connect(self._settings_mapper.map)
+        row_layout.addWidget(settings_button)
+
+        self.connection_list_layout.addWidget(row_widget)
+        self._rows[conn.id] = ConnectionRow(row_widget, name_label, url_label, connect_btn, disconnect_btn)
+
     def update_buttons_state(self):
         """
-        Enable/disable Connect/Disconnect buttons for each connection based on
-        which one is active.
+        Enable/disable Connect/Disconnect buttons based on which connection is
+        active. Every other row is already in the idle state, so only the
+        previously and newly active rows are touched.
         """
-        for i, (connect_btn, disconnect_btn) in enumerate(self.connection_buttons):
-            if self.active_connection_index is None:
-                # No active connection => all "Connect" buttons enabled, "Disconnect" disabled
-                connect_btn.setEnabled(True)
-                disconnect_btn.setEnabled(False)
-            else:
-                if i == self.active_connection_index:
-                    # For the active connection, disable "Connect", enable "Disconnect"
-                    connect_btn.setEnabled(False)
-                    disconnect_btn.setEnabled(True)
-                else:
-                    # For other connections, enable "Connect", disable "Disconnect"
-                    connect_btn.setEnabled(True)
-                    disconnect_btn.setEnabled(False)
-
-    def delete_connection(self, index):
-        """Remove the connection at 'index' from self.connections, then save & refresh."""
-        if 0 <= index < len(self.connections):
-            self.connections.pop(index)
-            self.save_all()
-            self.render_connections()
+        new_row = self._rows.get(self.active_connection_id)
+        if new_row is self._active_row:
+            return
+
+        if self._active_row is not None:
+            # Previously active row goes back to "Connect" enabled, "Disconnect" disabled
+            self._active_row.connect_btn.setEnabled(True)
+            self._active_row.disconnect_btn.setEnabled(False)
+        if new_row is not None:
+            # For the active connection, disable "Connect", enable "Disconnect"
+            new_row.connect_btn.setEnabled(False)
+            new_row.disconnect_btn.setEnabled(True)
+        self._active_row = new_row
+
+    def _connection_dialog(self, connection=None):
+        """Return the shared add/edit dialog, prepared for 'connection'."""
+        if self._add_dialog is None:
+            self._add_dialog = AddConnectionDialog(self, connection=connection)
+        else:
+            self._add_dialog.reset(connection=connection)
+        return self._add_dialog
+
+    def delete_connection(self, conn_id):
+        """Remove the connection with id 'conn_id', then save & drop its row."""
+        conn = self._conns_by_id.pop(conn_id, None)
+        if conn is None:
+            return
+        if self.active_connection_id == conn_id:
+            self.stop_chisel_process()
+            self.active_connection_id = None
+        self.connections.remove(conn)
+        self.schedule_save()
+        row = self._rows.pop(conn_id)
+        if row is self._active_row:
+            self._active_row = None
+        row.widget.deleteLater()
+        self.update_buttons_state()
+
     def add_connection_dialog(self):
         """Open dialog to add new connection."""
-        dialog = AddConnectionDialog(self)
+        dialog = self._connection_dialog()
         if dialog.exec():
             if dialog.connection is not None:
                 self.connections.append(dialog.connection)
-                self.save_all()
-                self.render_connections()
+                self._conns_by_id[dialog.connection.id] = dialog.connection
+                self.schedule_save()
+                self._append_row(dialog.connection)
 
-    def open_connection_settings(self, index):
-        connection_to_edit = self.connections[index]
-        dialog = AddConnectionDialog(self, connection=connection_to_edit, index=index)
+    def open_connection_settings(self, conn_id):
+        connection_to_edit = self._conns_by_id.get(conn_id)
+        if connection_to_edit is None:
+            return
+        dialog = self._connection_dialog(connection=connection_to_edit)
         if dialog.exec():
             # If the dialog closes normally (Save), changes are stored in connection_to_edit
-            self.save_all()
-            self.render_connections()
+            self.schedule_save()
+            row = self._rows[conn_id]
+            row.name_label.setText(connection_to_edit.name)
+            row.url_label.setText(connection_to_edit.url)
+            if conn_id == self.active_connection_id and self.active_process is not None \
+                    and self.active_process.state() == QProcess.Running:
+                # Keep the header in step with a renamed active connection
+                self._show_connected(connection_to_edit)
 
 
-    def connect_connection(self, index):
+    def connect_connection(self, conn_id):
         """
         Attempt to connect the selected connection.
         If another connection is active, disconnect it first.
         """
+        conn = self._conns_by_id.get(conn_id)
+        if conn is None:
+            return
+
         # Stop any running process if different from this one
-        if self.active_connection_index is not None and self.active_connection_index != index:
+        if self.active_connection_id is not None and self.active_connection_id != conn_id:
             self.stop_chisel_process()
-            self.active_connection_index = None
+            self.active_connection_id = None
 
-        # If we don't already have the process running for this index, start it.
-        if self.active_connection_index != index:
-            self.active_connection_index = index
-            self.start_chisel(self.connections[index])
+        # If we don't already have the process running for this connection, start it.
+        if self.active_connection_id != conn_id:
+            self.active_connection_id = conn_id
+            self.start_chisel(conn)
 
         self.update_buttons_state()
 
-    def disconnect_connection(self, index):
+    def disconnect_connection(self, conn_id):
         """
-        Disconnect if the given index is the currently active connection.
+        Disconnect if the given connection is the currently active one.
         """
-        if self.active_connection_index == index:
+        if self.active_connection_id == conn_id:
             self.stop_chisel_process()
-            self.active_connection_index = None
+            self.active_connection_id = None
             self.update_buttons_state()
 
     def start_chisel(self, conn: Connection):
         """Launch the chisel client for a given connection in the background."""
-        cmd = [
-            "chisel",
+        args = [
             "client",
             conn.url,
         ]
-        extra_args = conn.arguments.split()
-        cmd.extend(extra_args)
-
-        try:
-            self.active_process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            print(f"Started Chisel with command: {' '.join(cmd)}")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to start chisel:\n{str(e)}")
-            self.active_process = None
-            self.active_connection_index = None
+        args.extend(conn.args_list)
+
+        # Status updates are driven by the process signals, no polling needed
+        process = QProcess(self)
+        # Nobody reads chisel's output, so pass it straight through to our own
+        # stdout/stderr instead of letting it pile up in QProcess buffers
+        process.setProcessChannelMode(QProcess.ForwardedChannels)
+        process.started.connect(self._on_chisel_started)
+        process.finished.connect(self._on_chisel_finished)
+        process.errorOccurred.connect(self._on_chisel_error)
+        self.active_process = process
+        process.start("chisel", args)
 
     def stop_chisel_process(self):
         """Stop the currently running chisel process if any."""
-        if self.active_process and self.active_process.poll() is None:
-            self.active_process.terminate()
-            self.active_process.wait()
-            print("Stopped Chisel process.")
+        process = self.active_process
         self.active_process = None
+        if process is not None:
+            # This is an intentional stop, so don't report it as an unexpected exit
+            process.blockSignals(True)
+            if process.state() != QProcess.NotRunning:
+                process.terminate()
+                process.waitForFinished()
+                print("Stopped Chisel process.")
+            process.deleteLater()
+        self._set_status("Not Connected", False)
 
-    def update_connection_status(self):
-        """
-        Periodically check if the active chisel process is alive.
-        If alive => show "Connected to {connection_name}" (green).
-        Otherwise => "Not Connected" (red).
-        """
-        if self.active_connection_index is not None and self.active_process:
-            if self.active_process.poll() is None:
-                # Process is running => connected
-                conn_name = self.connections[self.active_connection_index].name
-                self.connection_status_label.setText(f"Connected to {conn_name}")
-                self.connection_status_label.setStyleSheet("color: green; font-size: 14px; font-weight: bold;")
-                return
-            else:
-                # Process ended unexpectedly
-                self.stop_chisel_process()
-                self.active_connection_index = None
-                self.update_buttons_state()
-
-        # If we reach here, not connected
-        self.connection_status_label.setText("Not Connected")
-        self.connection_status_label.setStyleSheet("color: red; font-size: 14px; font-weight: bold;")
+    @Slot()
+    def _on_chisel_started(self):
+        """The chisel client is running => show "Connected to {connection_name}" (green)."""
+        process = self.active_process
+        if process is not None:
+            print(f"Started Chisel with command: {process.program()} {' '.join(process.arguments())}")
+        if self.active_connection_id is not None:
+            self._show_connected(self._conns_by_id[self.active_connection_id])
+
+    @Slot(int, QProcess.ExitStatus)
+    def _on_chisel_finished(self, exit_code, exit_status):
+        """The chisel client ended unexpectedly => back to "Not Connected" (red)."""
+        self.stop_chisel_process()
+        self.active_connection_id = None
+        self.update_buttons_state()
+
+    @Slot(QProcess.ProcessError)
+    def _on_chisel_error(self, error):
+        """Report a chisel binary that could not be launched at all."""
+        if error != QProcess.FailedToStart:
+            # Crashes are followed by finished(), which handles the cleanup
+            return
+        message = self.active_process.errorString()
+        self.stop_chisel_process()
+        self.active_connection_id = None
+        self.update_buttons_state()
+        QMessageBox.critical(self, "Error", f"Failed to start chisel:\n{message}")
+
+    def _show_connected(self, conn: Connection):
+        """Show "Connected to {connection_name}" (green) for the given connection."""
+        self._set_status(f"Connected to {conn.name}", True)
+
+    def _set_status(self, text, connected):
+        """Update the status label; its colour follows the 'connected' property."""
+        status = (text, connected)
+        if status == self._last_status:
+            # Unchanged, so skip the re-polish and repaint
+            return
+        label = self.connection_status_label
+        label.setText(text)
+        if connected != self._last_status[1]:
+            # Re-evaluate the property selector only when the colour changes
+            label.setProperty("connected", connected)
+            label.style().unpolish(label)
+            label.style().polish(label)
+        self._last_status = status
 
     def open_global_settings(self):
         """Open the global Settings dialog."""
-        dialog = SettingsDialog(self, self.settings_data)
+        if self._settings_dialog is None:
+            self._settings_dialog = SettingsDialog(self, self.settings_data)
+        else:
+            self._settings_dialog.reset(self.settings_data)
+        dialog = self._settings_dialog
         if dialog.exec():
             self.settings_data = dialog.settings_data
-            self.save_all()
+            self.schedule_save()
 
     def closeEvent(self, event):
         """Override the close event to hide to tray or exit."""
-        reply = QMessageBox.question(
-            self,
-            "Minimize to Tray?",
-            "Do you want to close the window and keep it running in the system tray, or fully exit?",
-            QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel,
-            QMessageBox.Yes
-        )
+        self._close_msgbox.exec()
+        reply = self._close_msgbox.standardButton(self._close_msgbox.clickedButton())
         if reply == QMessageBox.Yes:
             event.ignore()
             self.hide()
         elif reply == QMessageBox.No:
-            self.tray_icon.hide()
+            if self.tray_icon is not None:
+                self.tray_icon.hide()
             self.stop_chisel_process()
             self.save_all()
             event.accept()
         else:
             event.ignore()
 
+    def schedule_save(self):
+        """Request a save; writes within SAVE_DEBOUNCE_MS of each other coalesce."""
+        self._save_timer.start()
+
     def save_all(self):
-        """Save all connections and settings to config file."""
-        data = {
-            "connections": [c.to_dict() for c in self.connections],
-            "settings": self.settings_data
-        }
-        save_config(data)
-        self.config_data = data
+        """Write every connection file, index and settings that changed since the last save."""
+        self._save_timer.stop()
+
+        for conn in self.connections:
+            state = _persisted_state(conn)
+            if self._saved_connections.get(conn.id) != state:
+                save_connection(conn)
+                self._saved_connections[conn.id] = state
+
+        current_ids = {conn.id for conn in self.connections}
+        for conn_id in [i for i in self._saved_connections if i not in current_ids]:
+            delete_connection_file(conn_id)
+            del self._saved_connections[conn_id]
+
+        order = tuple(conn.id for conn in self.connections)
+        if order != self._saved_order:
+            save_index(list(order))
+            self._saved_order = order
+
+        settings = tuple(self.settings_data.items())
+        if settings != self._saved_settings:
+            save_settings(self.settings_data)
+            self._saved_settings = settings
 
 
 def main():